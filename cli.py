@@ -25,8 +25,8 @@ except ImportError:
 
 # Try to import JIRA connector
 try:
-    from src.artifacts.jira_connector import JiraConnector
-    jira_connector = JiraConnector()
+    from src.artifacts.jira_connector import get_jira_connector
+    jira_connector = get_jira_connector()
     JIRA_AVAILABLE = jira_connector.is_available()
 except ImportError:
     jira_connector = None
@@ -95,8 +95,8 @@ def list_artifacts(args):
             return
         
         # List all project directories
-        projects = [d for d in os.listdir(artifact_manager.base_dir) 
-                  if os.path.isdir(os.path.join(artifact_manager.base_dir, d))]
+        with os.scandir(artifact_manager.base_dir) as entries:
+            projects = [entry for entry in entries if entry.is_dir()]
         
         if not projects:
             print("\nNo project artifacts found.")
@@ -105,14 +105,16 @@ def list_artifacts(args):
         print("\nAvailable Projects:")
         print("------------------")
         
+        # Build all rows first and emit them with a single write
+        rows = []
         for i, project in enumerate(projects, 1):
-            project_dir = os.path.join(artifact_manager.base_dir, project)
-            artifact_count = len([f for f in os.listdir(project_dir) 
-                              if os.path.isfile(os.path.join(project_dir, f))])
+            with os.scandir(project.path) as project_entries:
+                artifact_count = sum(1 for entry in project_entries if entry.is_file())
             
-            print(f"{i}. {project.replace('_', ' ').title()}")
-            print(f"   Artifacts: {artifact_count}")
-            print("   ------------------")
+            rows.append(f"{i}. {project.name.replace('_', ' ').title()}")
+            rows.append(f"   Artifacts: {artifact_count}")
+            rows.append("   ------------------")
+        print("\n".join(rows))
         
         print("\nUse 'python cli.py list-artifacts <project_name>' to view artifacts for a specific project.")
         return
@@ -124,8 +126,8 @@ def list_artifacts(args):
         return
     
     # Get all files in the project directory
-    artifacts = [f for f in os.listdir(project_dir) 
-              if os.path.isfile(os.path.join(project_dir, f))]
+    with os.scandir(project_dir) as entries:
+        artifacts = [entry for entry in entries if entry.is_file()]
     
     if not artifacts:
         print(f"\nNo artifacts found for project '{args.project_name}'.")
@@ -134,15 +136,17 @@ def list_artifacts(args):
     print(f"\nArtifacts for {args.project_name.replace('_', ' ').title()}:")
     print("------------------")
     
+    # Build all rows first and emit them with a single write
+    rows = []
     for i, artifact in enumerate(artifacts, 1):
-        artifact_path = os.path.join(project_dir, artifact)
-        artifact_size = os.path.getsize(artifact_path)
-        artifact_modified = datetime.fromtimestamp(os.path.getmtime(artifact_path))
+        artifact_stat = artifact.stat()
+        artifact_modified = datetime.fromtimestamp(artifact_stat.st_mtime)
         
-        print(f"{i}. {artifact}")
-        print(f"   Size: {artifact_size // 1024} KB")
-        print(f"   Modified: {artifact_modified.strftime('%Y-%m-%d %H:%M:%S')}")
-        print("   ------------------")
+        rows.append(f"{i}. {artifact.name}")
+        rows.append(f"   Size: {artifact_stat.st_size // 1024} KB")
+        rows.append(f"   Modified: {artifact_modified.strftime('%Y-%m-%d %H:%M:%S')}")
+        rows.append("   ------------------")
+    print("\n".join(rows))
     
     print("\nUse 'python cli.py view-artifact <project_name> <artifact_name>' to view an artifact.")
 
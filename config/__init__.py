@@ -5,7 +5,6 @@ Configuration package for Agentic Agile Crew
 import os
 import sys
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI  # Import directly to use OpenAI
 
 # Load environment variables from .env file
 load_dotenv()
@@ -140,6 +139,8 @@ def get_llm_config(temperature=0.2, model=None):
         openai_model = model or "gpt-4-turbo"
         
         # Simple direct approach - use OpenAI directly
+        from langchain_openai import ChatOpenAI
+        
         return ChatOpenAI(
             api_key=OPENAI_API_KEY,
             model=openai_model,
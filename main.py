@@ -5,6 +5,7 @@ Agentic Agile Crew - Main Application
 
 import os
 import sys
+import logging
 import argparse
 from dotenv import load_dotenv
 
@@ -77,6 +78,13 @@ def load_product_idea(product_idea=None):
         return input("> ")
 
 def main(product_idea=None, with_jira=False, use_openrouter=False):
+    # Library modules only attach NullHandlers; the application decides
+    # where their records go (a no-op if logging is already configured)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     # Set OpenRouter flag if passed from command line
     if use_openrouter:
         global USE_OPENROUTER
@@ -132,8 +140,8 @@ def main(product_idea=None, with_jira=False, use_openrouter=False):
     # Set up JIRA integration if requested
     if with_jira:
         try:
-            from src.artifacts.jira_connector import JiraConnector
-            jira_connector = JiraConnector()
+            from src.artifacts.jira_connector import get_jira_connector
+            jira_connector = get_jira_connector()
             
             if jira_connector.is_available():
                 if jira_connector.connect():
@@ -235,7 +243,8 @@ def main(product_idea=None, with_jira=False, use_openrouter=False):
         task_output_saver = TaskOutputSaver(
             artifact_service=artifact_service,
             jira_connector=jira_connector,
-            with_jira=with_jira
+            with_jira=with_jira,
+            verbose=CREW_VERBOSE
         )
         
         # Define artifact types for each task
@@ -287,6 +296,7 @@ def main(product_idea=None, with_jira=False, use_openrouter=False):
     
     if task_output_saver:
         print("\n===== Saving Artifacts =====\n")
+        completed_tasks = []
         
         # Get all task outputs from the crew result
         if hasattr(result, 'tasks_output') and result.tasks_output:
@@ -296,12 +306,13 @@ def main(product_idea=None, with_jira=False, use_openrouter=False):
                 if task_output and hasattr(task_output, 'task') and hasattr(task_output, 'raw_output'):
                     task = task_output.task
                     if task and hasattr(task, 'description'):
+                        completed_tasks.append(task)
+                        
                         # Save this task's output as an artifact
                         task_output_saver.save_output(task.description, task_output.raw_output)
         else:
             # Fallback: Try to get outputs directly from task objects
             print("Using fallback method to get task outputs")
-            completed_tasks = []
             for task in development_crew.tasks:
                 if hasattr(task, 'output') and task.output:
                     completed_tasks.append(task)
@@ -310,6 +321,10 @@ def main(product_idea=None, with_jira=False, use_openrouter=False):
                     task_output_saver.save_output(task.description, task.output)
         
         print(f"Saved artifacts for {len(completed_tasks)} completed tasks.")
+        task_output_saver.close()
+    
+    if artifact_service:
+        artifact_service.close()
     
     return result
 
@@ -0,0 +1,31 @@
+"""
+Shared LLM construction for the Agentic Agile Crew agents
+"""
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+@functools.lru_cache(maxsize=8)
+def get_llm(model: str, temperature: float) -> "ChatOpenAI":
+    """
+    Return a ChatOpenAI client for the given model and temperature.
+    
+    Clients are cached per (model, temperature) pair so repeated crew
+    assembly reuses the same HTTP session instead of building a new one.
+    
+    Args:
+        model (str): The model name to use.
+        temperature (float): The sampling temperature.
+        
+    Returns:
+        ChatOpenAI: A configured LLM client
+    """
+    from langchain_openai import ChatOpenAI
+    
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+    )
@@ -2,7 +2,6 @@
 Architect Agent for the Agentic Agile Crew with enhanced reasoning capabilities
 """
 
-from crewai import Agent
 from config.settings import AGENT_MEMORY, AGENT_ALLOW_DELEGATION
 from config import get_agent_llm
 
@@ -17,6 +16,9 @@ def create_architect(tools=None):
     Returns:
         Agent: A CrewAI Architect agent
     """
+    # Deferred so importing the agents package stays cheap for CLI commands
+    from crewai import Agent
+    
     # Get the LLM with appropriate settings for the architect role
     llm = get_agent_llm("architect")  # Higher temperature for more creative solutions
     
@@ -2,7 +2,6 @@
 Business Analyst Agent for the Agentic Agile Crew
 """
 
-from crewai import Agent
 from config.settings import AGENT_MEMORY, AGENT_ALLOW_DELEGATION
 from config import get_agent_llm
 
@@ -17,6 +16,9 @@ def create_business_analyst(tools=None):
     Returns:
         Agent: A CrewAI Business Analyst agent
     """
+    # Deferred so importing the agents package stays cheap for CLI commands
+    from crewai import Agent
+    
     # Get the LLM with appropriate settings for the business analyst role
     llm = get_agent_llm("business_analyst")  # Standard temperature
     
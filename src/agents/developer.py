@@ -2,7 +2,6 @@
 Developer Agent for the Agentic Agile Crew
 """
 
-from crewai import Agent
 from config.settings import AGENT_MEMORY, AGENT_ALLOW_DELEGATION
 from config import get_agent_llm
 
@@ -17,6 +16,9 @@ def create_developer(tools=None):
     Returns:
         Agent: A CrewAI Developer agent
     """
+    # Deferred so importing the agents package stays cheap for CLI commands
+    from crewai import Agent
+    
     # Get the LLM with appropriate settings for the developer role
     llm = get_agent_llm("developer")  # Lower temperature for precise code generation
     
@@ -2,9 +2,8 @@
 Project Manager Agent for the Agentic Agile Crew
 """
 
-from crewai import Agent
-from langchain_openai import ChatOpenAI
 from config.settings import LLM_MODEL, LLM_TEMPERATURE, AGENT_MEMORY, AGENT_ALLOW_DELEGATION
+from src.agents._llm import get_llm
 
 def create_project_manager(tools=None):
     """
@@ -17,11 +16,11 @@ def create_project_manager(tools=None):
     Returns:
         Agent: A CrewAI Project Manager agent
     """
+    # Deferred so importing the agents package stays cheap for CLI commands
+    from crewai import Agent
+    
     # Define the LLM
-    llm = ChatOpenAI(
-        model=LLM_MODEL,
-        temperature=LLM_TEMPERATURE,
-    )
+    llm = get_llm(LLM_MODEL, LLM_TEMPERATURE)
     
     # Create the Project Manager agent
     return Agent(
@@ -6,16 +6,14 @@ This module provides functionality to connect to JIRA and create epics and stori
 
 import os
 import re
-import logging
 import json
 from typing import Dict, Any, List, Optional, Union, Tuple
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger("jira_connector")
+# Import the logger setup
+from src.utils.logger import setup_logger
+
+# Configure logger
+logger = setup_logger("jira_connector")
 
 class JiraConnector:
     """
@@ -53,23 +51,34 @@ class JiraConnector:
         Returns:
             True if connection was successful, False otherwise
         """
+        if self.jira_client is not None:
+            return True
+        
         if not self.is_available():
             logger.warning("JIRA configuration is incomplete")
             return False
         
         try:
             from jira import JIRA
+            from requests.adapters import HTTPAdapter
             
-            # Create a JIRA client
-            self.jira_client = JIRA(
+            # Create a JIRA client, skipping the extra server-info round trip
+            jira_client = JIRA(
                 server=self.jira_url,
-                basic_auth=(self.jira_email, self.jira_api_token)
+                basic_auth=(self.jira_email, self.jira_api_token),
+                get_server_info=False
             )
             
+            # Pool keep-alive connections so TLS and auth are paid once per process
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+            jira_client._session.mount("https://", adapter)
+            jira_client._session.mount("http://", adapter)
+            
             # Test the connection
-            myself = self.jira_client.myself()
+            myself = jira_client.myself()
             logger.info(f"Connected to JIRA as {myself['displayName']}")
             
+            self.jira_client = jira_client
             return True
         except ImportError:
             logger.error("JIRA module not installed")
@@ -86,7 +95,9 @@ class JiraConnector:
             content: The content containing epics and stories
             
         Returns:
-            Dictionary with results of the operation
+            Dictionary with results of the operation. On success it holds
+            the number of epics and stories created ("n_epics", "n_stories")
+            and their issue keys ("created_keys")
         """
         if not self.jira_client:
             if not self.connect():
@@ -99,14 +110,31 @@ class JiraConnector:
         # and create actual epics and stories in JIRA
         logger.info("Creating epics and stories in JIRA")
         
-        epics = []
-        stories = []
+        epic_keys = []
+        story_keys = []
         
         # Simulate creating epics and stories
         logger.info(f"Would create epics and stories from content: {content[:100]}...")
         
         return {
             "success": True,
-            "epics": epics,
-            "stories": stories
+            "n_epics": len(epic_keys),
+            "n_stories": len(story_keys),
+            "created_keys": epic_keys + story_keys
         }
+
+
+# Shared connector so the JIRA session is reused across workflow runs
+_jira_connector: Optional[JiraConnector] = None
+
+def get_jira_connector() -> JiraConnector:
+    """
+    Get the process-wide JIRA connector, creating it on first use.
+    
+    Returns:
+        The shared JiraConnector instance
+    """
+    global _jira_connector
+    if _jira_connector is None:
+        _jira_connector = JiraConnector()
+    return _jira_connector
@@ -5,9 +5,17 @@ This module provides functionality to save and manage artifacts produced by
 the different agents in the workflow.
 """
 
+import asyncio
+import atexit
+import functools
+import json
 import os
 import re
 import shutil
+import stat
+import tempfile
+import threading
+import weakref
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
@@ -17,6 +25,36 @@ from src.utils.logger import setup_logger
 # Configure logger
 logger = setup_logger("artifact_manager")
 
+# Characters dropped from names, and runs of whitespace/dashes collapsed to "_"
+_RE_INVALID = re.compile(r'[^\w\s-]')
+_RE_WS = re.compile(r'[\s-]+')
+
+# Translation table for ASCII directory names: drops the characters that
+# r'[^\w\s-]' would remove and turns dashes into spaces so a plain split()
+# collapses them together with whitespace
+_ASCII_SANITIZE_TABLE = str.maketrans(
+    {
+        c: (" " if c == "-" else None)
+        for c in map(chr, range(128))
+        if c == "-" or not (c.isalnum() or c == "_" or c.isspace())
+    }
+)
+
+# Process umask, read once at import since querying it means setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Managers whose index is flushed at interpreter exit; weak so that
+# registering a manager doesn't keep it alive
+_open_managers = weakref.WeakSet()
+
+def _close_open_managers():
+    """Flush the index of every manager still alive at exit"""
+    for manager in list(_open_managers):
+        manager.close()
+
+atexit.register(_close_open_managers)
+
 class ArtifactManager:
     """
     Manages artifacts produced during the development workflow.
@@ -35,6 +73,9 @@ class ArtifactManager:
         "implementation code": "implementation_code.md"
     }
     
+    # Sidecar file in base_dir recording where each saved artifact lives
+    INDEX_FILENAME = ".artifact_index.json"
+    
     def __init__(self, base_dir: str = "dist"):
         """
         Initialize the artifact manager.
@@ -44,6 +85,14 @@ class ArtifactManager:
         """
         self.base_dir = base_dir
         self._ensure_base_dir_exists()
+        
+        # Maps product name -> artifact type -> path of the saved artifact
+        self._index: Dict[str, Dict[str, str]] = self._load_index()
+        self._index_dirty = False
+        # Guards the index against concurrent saves and flushes
+        self._index_lock = threading.Lock()
+        _open_managers.add(self)
+        
         logger.info(f"Initialized ArtifactManager with base directory: {self.base_dir}")
     
     def _ensure_base_dir_exists(self):
@@ -57,6 +106,60 @@ class ArtifactManager:
                 logger.error(f"Failed to create artifact directory: {e}")
                 print(f"Error creating artifact directory: {e}")
     
+    def _index_path(self) -> str:
+        """Path of the artifact index sidecar file"""
+        return os.path.join(self.base_dir, self.INDEX_FILENAME)
+    
+    def _load_index(self) -> Dict[str, Dict[str, str]]:
+        """
+        Load the artifact index from disk, dropping entries whose files are gone.
+        
+        Returns:
+            The artifact index, or an empty index if none could be loaded
+        """
+        index_path = self._index_path()
+        if not os.path.exists(index_path):
+            return {}
+        
+        try:
+            with open(index_path, 'r') as f:
+                raw_index = json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load artifact index from {index_path}: {e}")
+            return {}
+        
+        if not isinstance(raw_index, dict) or not all(
+            isinstance(artifacts, dict) for artifacts in raw_index.values()
+        ):
+            logger.warning(f"Ignoring malformed artifact index at {index_path}")
+            return {}
+        
+        index = {}
+        for product_name, artifacts in raw_index.items():
+            existing = {
+                artifact_type: path
+                for artifact_type, path in artifacts.items()
+                if isinstance(path, str) and os.path.isfile(path)
+            }
+            if existing:
+                index[product_name] = existing
+        
+        logger.debug("Loaded artifact index with %s projects", len(index))
+        return index
+    
+    def close(self):
+        """Flush the artifact index to disk if it has changed"""
+        with self._index_lock:
+            if not self._index_dirty or not os.path.isdir(self.base_dir):
+                return
+            
+            try:
+                self._write_bytes(self._index_path(), json.dumps(self._index).encode('utf-8'))
+                self._index_dirty = False
+                logger.debug("Flushed artifact index to %s", self._index_path())
+            except Exception as e:
+                logger.error(f"Failed to write artifact index: {e}")
+    
     def sanitize_directory_name(self, name: str) -> str:
         """
         Convert a product idea name to a valid directory name.
@@ -77,13 +180,16 @@ class ArtifactManager:
                 name = first_line
                 
         # Remove special characters, replace spaces with underscores
-        sanitized = re.sub(r'[^\w\s-]', '', name)
-        sanitized = re.sub(r'[\s-]+', '_', sanitized)
+        if name.isascii():
+            sanitized = "_".join(name.translate(_ASCII_SANITIZE_TABLE).split())
+        else:
+            sanitized = _RE_INVALID.sub('', name)
+            sanitized = _RE_WS.sub('_', sanitized)
         
         # Ensure we don't have trailing underscores
         sanitized = sanitized.strip('_')
         
-        logger.debug(f"Sanitized directory name from '{name}' to '{sanitized.lower()}'")
+        logger.debug("Sanitized directory name from '%s' to '%s'", name, sanitized.lower())
         return sanitized.lower()
     
     def create_project_directory(self, product_idea_name: str) -> str:
@@ -101,12 +207,12 @@ class ArtifactManager:
         
         if not os.path.exists(project_dir):
             try:
-                os.makedirs(project_dir)
+                os.makedirs(project_dir, exist_ok=True)
                 logger.info(f"Created project directory: {project_dir}")
             except Exception as e:
                 logger.error(f"Failed to create project directory: {e}")
         else:
-            logger.debug(f"Project directory already exists: {project_dir}")
+            logger.debug("Project directory already exists: %s", project_dir)
         
         return project_dir
     
@@ -122,19 +228,33 @@ class ArtifactManager:
         Returns:
             Path to the saved artifact
         """
+        return self._save_sync(product_idea_name, artifact_type, content)
+    
+    async def save_artifact_async(self, product_idea_name: str, artifact_type: str, content: str) -> str:
+        """
+        Save an artifact without blocking the event loop.
+        
+        The write is offloaded to the default thread pool so it can overlap
+        with the next agent step.
+        
+        Args:
+            product_idea_name: Name of the product idea
+            artifact_type: Type of artifact (e.g., "requirements", "PRD document")
+            content: Content of the artifact
+            
+        Returns:
+            Path to the saved artifact
+        """
+        return await asyncio.to_thread(self._save_sync, product_idea_name, artifact_type, content)
+    
+    def _save_sync(self, product_idea_name: str, artifact_type: str, content: str) -> str:
+        """Write an artifact to disk on the calling thread and return its path"""
         logger.info(f"Saving artifact of type '{artifact_type}' for '{product_idea_name}'")
         project_dir = self.create_project_directory(product_idea_name)
         
         # Determine filename based on artifact type
-        if artifact_type in self.ARTIFACT_FILE_MAPPING:
-            filename = self.ARTIFACT_FILE_MAPPING[artifact_type]
-            logger.debug(f"Using predefined filename '{filename}' for artifact type '{artifact_type}'")
-        else:
-            # For unknown types, use a generic name
-            sanitized_type = re.sub(r'[^\w\s-]', '', artifact_type)
-            sanitized_type = re.sub(r'[\s-]+', '_', sanitized_type)
-            filename = f"{sanitized_type.lower()}.md"
-            logger.debug(f"Generated filename '{filename}' for unknown artifact type '{artifact_type}'")
+        filename = _filename_for(artifact_type)
+        logger.debug("Using filename '%s' for artifact type '%s'", filename, artifact_type)
         
         # Special handling for implementation code
         if artifact_type == "implementation code":
@@ -142,8 +262,8 @@ class ArtifactManager:
             code_dir = os.path.join(project_dir, "implementation_code")
             if not os.path.exists(code_dir):
                 try:
-                    os.makedirs(code_dir)
-                    logger.debug(f"Created implementation code directory: {code_dir}")
+                    os.makedirs(code_dir, exist_ok=True)
+                    logger.debug("Created implementation code directory: %s", code_dir)
                 except Exception as e:
                     logger.error(f"Failed to create implementation code directory: {e}")
             
@@ -155,17 +275,88 @@ class ArtifactManager:
         else:
             filepath = os.path.join(project_dir, filename)
         
-        # Save the content
+        # Save the content, encoding once and writing the raw bytes to skip
+        # the TextIOWrapper layer
         try:
-            with open(filepath, 'w') as f:
-                f.write(content)
+            self._write_bytes(filepath, content.encode('utf-8'))
             logger.info(f"Saved artifact to: {filepath}")
         except Exception as e:
             logger.error(f"Failed to save artifact to {filepath}: {e}")
             raise
         
+        with self._index_lock:
+            self._index.setdefault(product_idea_name, {})[artifact_type] = filepath
+            self._index_dirty = True
+        
         return filepath
     
+    def _write_bytes(self, filepath: str, data: bytes):
+        """
+        Atomically replace a file's content with raw os-level calls.
+        
+        The data is written to a temporary sibling file, flushed to disk with
+        fsync and then renamed over the target, so neither a failed write nor
+        a crash or power loss leaves a truncated file behind.
+        
+        Args:
+            filepath: Path of the file to write
+            data: Encoded content to write
+        """
+        # A unique temp name per writer, so concurrent saves of the same
+        # artifact never share (and truncate) one another's temp file
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(filepath) or ".",
+            prefix=os.path.basename(filepath) + ".",
+            suffix=".tmp"
+        )
+        try:
+            try:
+                # mkstemp creates 0600 files; keep the target's mode, or the
+                # mode a plain open() would give a new file
+                try:
+                    mode = stat.S_IMODE(os.stat(filepath).st_mode)
+                except FileNotFoundError:
+                    mode = 0o666 & ~_UMASK
+                os.chmod(tmp_path, mode)
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+                # The data must be on disk before the rename makes it visible
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._fsync_dir(os.path.dirname(filepath) or ".")
+    
+    @staticmethod
+    def _fsync_dir(dirpath: str):
+        """
+        Flush a directory entry so a rename into it survives a power loss.
+        
+        Args:
+            dirpath: Directory to flush; skipped where directories can't be opened
+        """
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        try:
+            dir_fd = os.open(dirpath, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError as e:
+            logger.debug("Could not open %s to fsync it: %s", dirpath, e)
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError as e:
+            logger.debug("Could not fsync directory %s: %s", dirpath, e)
+        finally:
+            os.close(dir_fd)
+    
     def get_artifact_path(self, product_idea_name: str, artifact_type: str) -> str:
         """
         Get the path to an artifact.
@@ -177,18 +368,13 @@ class ArtifactManager:
         Returns:
             Path to the artifact
         """
-        project_dir = self.create_project_directory(product_idea_name)
+        indexed_path = self._index.get(product_idea_name, {}).get(artifact_type)
+        if indexed_path:
+            return indexed_path
         
-        # Determine filename based on artifact type
-        if artifact_type in self.ARTIFACT_FILE_MAPPING:
-            filename = self.ARTIFACT_FILE_MAPPING[artifact_type]
-        else:
-            # For unknown types, use a generic name
-            sanitized_type = re.sub(r'[^\w\s-]', '', artifact_type)
-            sanitized_type = re.sub(r'[\s-]+', '_', sanitized_type)
-            filename = f"{sanitized_type.lower()}.md"
+        project_dir = self.create_project_directory(product_idea_name)
         
-        return os.path.join(project_dir, filename)
+        return os.path.join(project_dir, _filename_for(artifact_type))
     
     def list_artifacts(self, product_idea_name: str) -> List[str]:
         """
@@ -200,15 +386,27 @@ class ArtifactManager:
         Returns:
             List of artifact paths
         """
+        # Always scan rather than trusting the index: it is only flushed on
+        # close(), and directories may hold files saved before it existed
         project_dir = self.create_project_directory(product_idea_name)
         artifacts = []
         
-        for root, dirs, files in os.walk(project_dir):
-            for file in files:
-                artifacts.append(os.path.join(root, file))
+        # The layout is flat apart from the implementation_code/ subdirectory,
+        # so a single level of recursion is enough
+        try:
+            with os.scandir(project_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        artifacts.append(entry.path)
+                    elif entry.is_dir():
+                        with os.scandir(entry.path) as sub_entries:
+                            artifacts.extend(sub.path for sub in sub_entries if sub.is_file())
+        except FileNotFoundError:
+            logger.warning(f"Project directory not found: {project_dir}")
+            return []
         
         logger.info(f"Found {len(artifacts)} artifacts for '{product_idea_name}'")
-        logger.debug(f"Artifacts: {artifacts}")
+        logger.debug("Artifacts: %s", artifacts)
         
         return artifacts
     
@@ -229,7 +427,7 @@ class ArtifactManager:
             try:
                 with open(filepath, 'r') as f:
                     content = f.read()
-                logger.debug(f"Read artifact: {filepath}")
+                logger.debug("Read artifact: %s", filepath)
                 return content
             except Exception as e:
                 logger.error(f"Failed to read artifact from {filepath}: {e}")
@@ -254,28 +452,47 @@ class ArtifactManager:
             logger.info(f"Empty product idea, using generated name: {name}")
             return name
         
-        # Try to extract from markdown heading
-        lines = product_idea.strip().split("\n")
-        if lines and lines[0].startswith("#"):
-            name = lines[0].lstrip("# ").strip()
-            logger.debug(f"Extracted product name from markdown heading: {name}")
+        # Try to extract from markdown heading, splitting off only the first line
+        first_line, _, rest = product_idea.strip().partition("\n")
+        if first_line.startswith("#"):
+            name = first_line.lstrip("# ").strip()
+            logger.debug("Extracted product name from markdown heading: %s", name)
             return name
         
         # Try to find any markdown heading
-        for line in lines:
+        for line in rest.split("\n"):
             if line.startswith("#"):
                 name = line.lstrip("# ").strip()
-                logger.debug(f"Extracted product name from embedded markdown heading: {name}")
+                logger.debug("Extracted product name from embedded markdown heading: %s", name)
                 return name
         
-        # If no heading, use the first non-empty line
-        for line in lines:
-            if line.strip():
-                name = line.strip()
-                logger.debug(f"Extracted product name from first non-empty line: {name}")
-                return name
+        # If no heading, use the first line (non-empty after the strip above)
+        name = first_line.strip()
+        if name:
+            logger.debug("Extracted product name from first non-empty line: %s", name)
+            return name
         
         # Fallback to timestamp
         name = f"project_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         logger.info(f"Could not extract name from product idea, using generated name: {name}")
         return name
+
+
+@functools.lru_cache(maxsize=128)
+def _filename_for(artifact_type: str) -> str:
+    """
+    Get the file name used to store an artifact type.
+    
+    Args:
+        artifact_type: Type of artifact
+        
+    Returns:
+        The predefined file name, or a generic name derived from the type
+    """
+    if artifact_type in ArtifactManager.ARTIFACT_FILE_MAPPING:
+        return ArtifactManager.ARTIFACT_FILE_MAPPING[artifact_type]
+    
+    # For unknown types, use a generic name
+    sanitized_type = _RE_INVALID.sub('', artifact_type)
+    sanitized_type = _RE_WS.sub('_', sanitized_type)
+    return f"{sanitized_type.lower()}.md"
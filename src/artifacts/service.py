@@ -5,7 +5,9 @@ This module provides a service for saving artifacts produced by
 the different agents in the workflow, independent of the human review process.
 """
 
-from typing import Optional, Any
+import asyncio
+import concurrent.futures
+from typing import Optional, Any, List, Tuple
 
 from src.artifacts.manager import ArtifactManager
 from src.utils.logger import setup_logger
@@ -29,10 +31,13 @@ class ArtifactService:
         self.product_name = None
         # Flag to track whether callbacks are attached
         self._callbacks_attached = False
+        # Pool for saving several artifacts concurrently, created on the
+        # first bulk save
+        self._pool = None
         
         logger.info("Initialized ArtifactService")
         if artifact_manager:
-            logger.debug(f"Using ArtifactManager with base directory: {artifact_manager.base_dir}")
+            logger.debug("Using ArtifactManager with base directory: %s", artifact_manager.base_dir)
         else:
             logger.warning("No ArtifactManager provided, artifacts won't be saved")
     
@@ -86,6 +91,44 @@ class ArtifactService:
             logger.error(f"Error saving artifact: {e}", exc_info=True)
             return None
     
+    async def save_artifact_async(self, artifact_type: str, content: Any) -> Optional[str]:
+        """
+        Save an artifact from a worker thread so the caller's event loop
+        can move on to the next agent step.
+        
+        Args:
+            artifact_type: The type of artifact
+            content: The content of the artifact (string or object with string representation)
+            
+        Returns:
+            The path to the saved artifact, or None if saving failed
+        """
+        return await asyncio.to_thread(self.save_artifact, artifact_type, content)
+    
+    def save_artifacts_bulk(self, items: List[Tuple[str, Any]]) -> List[Optional[str]]:
+        """
+        Save several artifacts concurrently.
+        
+        Args:
+            items: List of (artifact_type, content) tuples
+            
+        Returns:
+            The path for each saved artifact, or None where saving failed,
+            in the same order as items
+        """
+        logger.info("Saving %s artifacts in bulk", len(items))
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=6, thread_name_prefix="artifact"
+            )
+        return list(self._pool.map(lambda item: self.save_artifact(*item), items))
+    
+    def close(self):
+        """Shut down the artifact saving pool, waiting for pending saves"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+    
     def _ensure_string(self, content: Any) -> str:
         """
         Ensure content is a string.
@@ -96,60 +139,30 @@ class ArtifactService:
         Returns:
             String representation of the content
         """
+        # Fast path for the common case - agent outputs are usually plain strings
+        if type(content) is str:
+            return content
+        
         # Handle None case
         if content is None:
             logger.debug("Converting None content to string")
             return "None"
             
-        # Already a string
+        # String subclasses
         if isinstance(content, str):
             logger.debug("Content is already a string")
             return content
         
         # Handle various object types - avoid recursion
         try:
-            logger.debug(f"Converting object of type {type(content).__name__} to string")
+            logger.debug("Converting object of type %s to string", type(content).__name__)
             
-            # Direct checks for specific attributes to avoid recursion
-            if hasattr(content, 'raw_output'):
-                raw_output = content.raw_output
-                logger.debug("Using 'raw_output' attribute")
-                if isinstance(raw_output, str):
-                    return raw_output
-                else:
-                    return str(raw_output)
-                    
-            elif hasattr(content, 'output'):
-                output = content.output
-                logger.debug("Using 'output' attribute")
-                if isinstance(output, str):
-                    return output
-                else:
-                    return str(output)
-                    
-            elif hasattr(content, 'result'):
-                result = content.result
-                logger.debug("Using 'result' attribute")
-                if isinstance(result, str):
-                    return result
-                else:
-                    return str(result)
-                    
-            elif hasattr(content, 'response'):
-                response = content.response
-                logger.debug("Using 'response' attribute")
-                if isinstance(response, str):
-                    return response
-                else:
-                    return str(response)
-                    
-            elif hasattr(content, 'content'):
-                content_attr = content.content
-                logger.debug("Using 'content' attribute")
-                if isinstance(content_attr, str):
-                    return content_attr
-                else:
-                    return str(content_attr)
+            # Direct checks for specific attributes to avoid recursion;
+            # str() returns an existing str unchanged, so no type check is needed
+            for attr in ('raw_output', 'output', 'result', 'response', 'content'):
+                if hasattr(content, attr):
+                    logger.debug("Using '%s' attribute", attr)
+                    return str(getattr(content, attr))
             
             # Fallback to string conversion
             logger.debug("Using fallback str() conversion")
@@ -2,25 +2,11 @@
 Architecture Design Task for the Agentic Agile Crew
 """
 
+import functools
+
 from crewai import Task
 
-def create_architecture_design_task(agent, dependent_tasks, technical_preferences=None):
-    """
-    Creates a task for the Architect to design a technical architecture
-    based on the business requirements and PRD.
-    
-    Args:
-        agent (Agent): The Architect agent.
-        dependent_tasks (list): Tasks this task depends on, typically business analysis and PRD tasks.
-        technical_preferences (str, optional): Extracted technical preferences from the product idea.
-        
-    Returns:
-        Task: A CrewAI Task for architecture design.
-    """
-    # Add technical preferences section if provided
-    tech_prefs_section = ""
-    if technical_preferences:
-        tech_prefs_section = f"""
+PREFERENCES_TEMPLATE = """
         IMPORTANT - Consider these Technical Preferences in your architecture decisions:
         
         {technical_preferences}
@@ -29,9 +15,8 @@ def create_architecture_design_task(agent, dependent_tasks, technical_preference
         be carefully considered in your architectural decisions. If there are any
         conflicts or trade-offs required, explicitly explain your reasoning.
         """
-    
-    return Task(
-        description=f"""
+
+DESCRIPTION_TEMPLATE = """
         Design a comprehensive technical architecture for the product based on the 
         business requirements and PRD provided.
         
@@ -92,8 +77,33 @@ def create_architecture_design_task(agent, dependent_tasks, technical_preference
         Your architecture should be well-reasoned, technically sound, and aligned with 
         the business requirements and PRD. Document any assumptions made during the 
         architecture design process.
-        """,
-        expected_output="A comprehensive technical architecture document with technology choices, data models, API specifications, security infrastructure, and detailed reasoning for all decisions.",
+        """
+
+_new_task = functools.partial(
+    Task,
+    expected_output="A comprehensive technical architecture document with technology choices, data models, API specifications, security infrastructure, and detailed reasoning for all decisions."
+)
+
+def create_architecture_design_task(agent, dependent_tasks, technical_preferences=None):
+    """
+    Creates a task for the Architect to design a technical architecture
+    based on the business requirements and PRD.
+    
+    Args:
+        agent (Agent): The Architect agent.
+        dependent_tasks (list): Tasks this task depends on, typically business analysis and PRD tasks.
+        technical_preferences (str, optional): Extracted technical preferences from the product idea.
+        
+    Returns:
+        Task: A CrewAI Task for architecture design.
+    """
+    # Add technical preferences section if provided
+    tech_prefs_section = ""
+    if technical_preferences:
+        tech_prefs_section = PREFERENCES_TEMPLATE.format(technical_preferences=technical_preferences)
+    
+    return _new_task(
+        description=DESCRIPTION_TEMPLATE.format(tech_prefs_section=tech_prefs_section),
         agent=agent,
         depends_on=dependent_tasks
     )
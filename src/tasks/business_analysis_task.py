@@ -2,25 +2,11 @@
 Business Analysis Task for the Agentic Agile Crew
 """
 
+import functools
+
 from crewai import Task
 
-def create_business_analysis_task(agent, product_idea, business_preferences=None):
-    """
-    Creates a task for the Business Analyst to refine a product idea
-    into comprehensive business requirements.
-    
-    Args:
-        agent (Agent): The Business Analyst agent.
-        product_idea (str): The initial product idea text.
-        business_preferences (str, optional): Extracted business preferences from the product idea.
-        
-    Returns:
-        Task: A CrewAI Task for business analysis.
-    """
-    # Add business preferences section if provided
-    biz_prefs_section = ""
-    if business_preferences:
-        biz_prefs_section = f"""
+PREFERENCES_TEMPLATE = """
         IMPORTANT - Consider these Business Requirements in your analysis:
         
         {business_preferences}
@@ -28,9 +14,8 @@ def create_business_analysis_task(agent, product_idea, business_preferences=None
         These requirements have been extracted directly from the product idea and should
         be carefully incorporated into your detailed business analysis.
         """
-    
-    return Task(
-        description=f"""
+
+DESCRIPTION_TEMPLATE = """
         Analyze the following product idea and create comprehensive business requirements:
         
         {product_idea}
@@ -67,7 +52,32 @@ def create_business_analysis_task(agent, product_idea, business_preferences=None
         
         Present your analysis in a well-structured document that clearly communicates the 
         business requirements for this product.
-        """,
-        expected_output="A comprehensive business requirements document including target audience, market analysis, core features, success metrics, and constraints.",
+        """
+
+_new_task = functools.partial(
+    Task,
+    expected_output="A comprehensive business requirements document including target audience, market analysis, core features, success metrics, and constraints."
+)
+
+def create_business_analysis_task(agent, product_idea, business_preferences=None):
+    """
+    Creates a task for the Business Analyst to refine a product idea
+    into comprehensive business requirements.
+    
+    Args:
+        agent (Agent): The Business Analyst agent.
+        product_idea (str): The initial product idea text.
+        business_preferences (str, optional): Extracted business preferences from the product idea.
+        
+    Returns:
+        Task: A CrewAI Task for business analysis.
+    """
+    # Add business preferences section if provided
+    biz_prefs_section = ""
+    if business_preferences:
+        biz_prefs_section = PREFERENCES_TEMPLATE.format(business_preferences=business_preferences)
+    
+    return _new_task(
+        description=DESCRIPTION_TEMPLATE.format(product_idea=product_idea, biz_prefs_section=biz_prefs_section),
         agent=agent
     )
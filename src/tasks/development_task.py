@@ -2,25 +2,11 @@
 Development Task for the Agentic Agile Crew
 """
 
+import functools
+
 from crewai import Task
 
-def create_development_task(agent, dependent_tasks, developer_preferences=None):
-    """
-    Creates a task for the Developer to implement user stories based on
-    the JIRA epics/stories and architecture document.
-    
-    Args:
-        agent (Agent): The Developer agent.
-        dependent_tasks (list): Tasks this task depends on, typically JIRA and architecture tasks.
-        developer_preferences (str, optional): Extracted preferences for the Developer.
-        
-    Returns:
-        Task: A CrewAI Task for development implementation.
-    """
-    # Add developer preferences section if provided
-    dev_prefs_section = ""
-    if developer_preferences:
-        dev_prefs_section = f"""
+PREFERENCES_TEMPLATE = """
         IMPORTANT - Consider these Development Preferences:
         
         {developer_preferences}
@@ -28,9 +14,8 @@ def create_development_task(agent, dependent_tasks, developer_preferences=None):
         These preferences have been extracted directly from the product idea and should
         be carefully incorporated into your implementation.
         """
-    
-    return Task(
-        description=f"""
+
+DESCRIPTION_TEMPLATE = """
         Implement a high-quality prototype implementation based on the JIRA stories
         and architecture document provided.
         
@@ -70,8 +55,33 @@ def create_development_task(agent, dependent_tasks, developer_preferences=None):
         Your implementation should be clean, well-documented, and follow the
         architecture guidelines. Focus on delivering a solid foundation that demonstrates
         the key functionality rather than implementing every feature completely.
-        """,
-        expected_output="A high-quality code implementation that demonstrates the core functionality described in the user stories, following the architecture guidelines and best practices.",
+        """
+
+_new_task = functools.partial(
+    Task,
+    expected_output="A high-quality code implementation that demonstrates the core functionality described in the user stories, following the architecture guidelines and best practices."
+)
+
+def create_development_task(agent, dependent_tasks, developer_preferences=None):
+    """
+    Creates a task for the Developer to implement user stories based on
+    the JIRA epics/stories and architecture document.
+    
+    Args:
+        agent (Agent): The Developer agent.
+        dependent_tasks (list): Tasks this task depends on, typically JIRA and architecture tasks.
+        developer_preferences (str, optional): Extracted preferences for the Developer.
+        
+    Returns:
+        Task: A CrewAI Task for development implementation.
+    """
+    # Add developer preferences section if provided
+    dev_prefs_section = ""
+    if developer_preferences:
+        dev_prefs_section = PREFERENCES_TEMPLATE.format(developer_preferences=developer_preferences)
+    
+    return _new_task(
+        description=DESCRIPTION_TEMPLATE.format(dev_prefs_section=dev_prefs_section),
         agent=agent,
         depends_on=dependent_tasks
     )
@@ -2,25 +2,11 @@
 JIRA Creation Task for the Agentic Agile Crew
 """
 
+import functools
+
 from crewai import Task
 
-def create_jira_creation_task(agent, dependent_tasks, scrum_master_preferences=None):
-    """
-    Creates a task for the Scrum Master to create epics and user stories in JIRA
-    based on the task list, architecture document, and PRD.
-    
-    Args:
-        agent (Agent): The Scrum Master agent.
-        dependent_tasks (list): Tasks this task depends on, typically task list, architecture, and PRD tasks.
-        scrum_master_preferences (str, optional): Extracted preferences for the Scrum Master.
-        
-    Returns:
-        Task: A CrewAI Task for JIRA creation.
-    """
-    # Add scrum master preferences section if provided
-    scrum_prefs_section = ""
-    if scrum_master_preferences:
-        scrum_prefs_section = f"""
+PREFERENCES_TEMPLATE = """
         IMPORTANT - Consider these Scrum and User Story Preferences:
         
         {scrum_master_preferences}
@@ -28,9 +14,8 @@ def create_jira_creation_task(agent, dependent_tasks, scrum_master_preferences=N
         These preferences have been extracted directly from the product idea and should
         be carefully incorporated into your epic and user story creation.
         """
-    
-    return Task(
-        description=f"""
+
+DESCRIPTION_TEMPLATE = """
         Create well-structured epics and user stories suitable for JIRA based on the 
         task list, architecture document, and PRD provided.
         
@@ -75,8 +60,33 @@ def create_jira_creation_task(agent, dependent_tasks, scrum_master_preferences=N
         Format your output as a structured document that could be directly imported 
         into JIRA or used by a team to manually create the tickets. Organize stories 
         within their parent epics for clarity.
-        """,
-        expected_output="A well-structured document containing epics and user stories ready for JIRA, with acceptance criteria, technical details, and proper organization.",
+        """
+
+_new_task = functools.partial(
+    Task,
+    expected_output="A well-structured document containing epics and user stories ready for JIRA, with acceptance criteria, technical details, and proper organization."
+)
+
+def create_jira_creation_task(agent, dependent_tasks, scrum_master_preferences=None):
+    """
+    Creates a task for the Scrum Master to create epics and user stories in JIRA
+    based on the task list, architecture document, and PRD.
+    
+    Args:
+        agent (Agent): The Scrum Master agent.
+        dependent_tasks (list): Tasks this task depends on, typically task list, architecture, and PRD tasks.
+        scrum_master_preferences (str, optional): Extracted preferences for the Scrum Master.
+        
+    Returns:
+        Task: A CrewAI Task for JIRA creation.
+    """
+    # Add scrum master preferences section if provided
+    scrum_prefs_section = ""
+    if scrum_master_preferences:
+        scrum_prefs_section = PREFERENCES_TEMPLATE.format(scrum_master_preferences=scrum_master_preferences)
+    
+    return _new_task(
+        description=DESCRIPTION_TEMPLATE.format(scrum_prefs_section=scrum_prefs_section),
         agent=agent,
         depends_on=dependent_tasks
     )
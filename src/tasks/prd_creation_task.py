@@ -2,25 +2,11 @@
 PRD Creation Task for the Agentic Agile Crew
 """
 
+import functools
+
 from crewai import Task
 
-def create_prd_creation_task(agent, dependent_tasks, project_management_preferences=None):
-    """
-    Creates a task for the Project Manager to create a detailed
-    Product Requirements Document (PRD) based on business requirements.
-    
-    Args:
-        agent (Agent): The Project Manager agent.
-        dependent_tasks (list): Tasks this task depends on, typically the business analysis task.
-        project_management_preferences (str, optional): Extracted project management preferences.
-        
-    Returns:
-        Task: A CrewAI Task for PRD creation.
-    """
-    # Add project management preferences section if provided
-    pm_prefs_section = ""
-    if project_management_preferences:
-        pm_prefs_section = f"""
+PREFERENCES_TEMPLATE = """
         IMPORTANT - Consider these Project Management Preferences in your PRD:
         
         {project_management_preferences}
@@ -28,9 +14,8 @@ def create_prd_creation_task(agent, dependent_tasks, project_management_preferen
         These preferences have been extracted directly from the product idea and should
         be carefully incorporated into your Product Requirements Document.
         """
-    
-    return Task(
-        description=f"""
+
+DESCRIPTION_TEMPLATE = """
         Based on the business requirements provided by the Business Analyst, create a comprehensive 
         Product Requirements Document (PRD).
         
@@ -78,8 +63,33 @@ def create_prd_creation_task(agent, dependent_tasks, project_management_preferen
         
         Present your PRD in a clear, well-structured format that developers, designers, and stakeholders 
         can easily understand. Ask clarifying questions about any ambiguous requirements before finalizing.
-        """,
-        expected_output="A detailed Product Requirements Document (PRD) that clearly specifies all functional and non-functional requirements for the product.",
+        """
+
+_new_task = functools.partial(
+    Task,
+    expected_output="A detailed Product Requirements Document (PRD) that clearly specifies all functional and non-functional requirements for the product."
+)
+
+def create_prd_creation_task(agent, dependent_tasks, project_management_preferences=None):
+    """
+    Creates a task for the Project Manager to create a detailed
+    Product Requirements Document (PRD) based on business requirements.
+    
+    Args:
+        agent (Agent): The Project Manager agent.
+        dependent_tasks (list): Tasks this task depends on, typically the business analysis task.
+        project_management_preferences (str, optional): Extracted project management preferences.
+        
+    Returns:
+        Task: A CrewAI Task for PRD creation.
+    """
+    # Add project management preferences section if provided
+    pm_prefs_section = ""
+    if project_management_preferences:
+        pm_prefs_section = PREFERENCES_TEMPLATE.format(project_management_preferences=project_management_preferences)
+    
+    return _new_task(
+        description=DESCRIPTION_TEMPLATE.format(pm_prefs_section=pm_prefs_section),
         agent=agent,
         depends_on=dependent_tasks
     )
@@ -2,25 +2,11 @@
 Task List Creation Task for the Agentic Agile Crew
 """
 
+import functools
+
 from crewai import Task
 
-def create_task_list_creation_task(agent, dependent_tasks, product_owner_preferences=None):
-    """
-    Creates a task for the Product Owner to create a granular, sequenced task list
-    based on the PRD and architecture documents.
-    
-    Args:
-        agent (Agent): The Product Owner agent.
-        dependent_tasks (list): Tasks this task depends on, typically PRD and architecture tasks.
-        product_owner_preferences (str, optional): Extracted preferences for the Product Owner.
-        
-    Returns:
-        Task: A CrewAI Task for task list creation.
-    """
-    # Add product owner preferences section if provided
-    po_prefs_section = ""
-    if product_owner_preferences:
-        po_prefs_section = f"""
+PREFERENCES_TEMPLATE = """
         IMPORTANT - Consider these Product Owner Preferences in your task breakdown:
         
         {product_owner_preferences}
@@ -28,9 +14,8 @@ def create_task_list_creation_task(agent, dependent_tasks, product_owner_prefere
         These preferences have been extracted directly from the product idea and should
         be carefully incorporated into your task list creation.
         """
-    
-    return Task(
-        description=f"""
+
+DESCRIPTION_TEMPLATE = """
         Create a detailed, granular, and sequenced task list based on the PRD and 
         technical architecture provided.
         
@@ -70,8 +55,33 @@ def create_task_list_creation_task(agent, dependent_tasks, product_owner_prefere
         Your task list should be structured, detailed, and comprehensive, providing 
         clear guidance for the development team. Each task should align with the 
         requirements in the PRD and follow the architecture guidelines.
-        """,
-        expected_output="A detailed, granular, and sequenced task list that breaks down the project into actionable tasks with priorities, dependencies, and effort estimates.",
+        """
+
+_new_task = functools.partial(
+    Task,
+    expected_output="A detailed, granular, and sequenced task list that breaks down the project into actionable tasks with priorities, dependencies, and effort estimates."
+)
+
+def create_task_list_creation_task(agent, dependent_tasks, product_owner_preferences=None):
+    """
+    Creates a task for the Product Owner to create a granular, sequenced task list
+    based on the PRD and architecture documents.
+    
+    Args:
+        agent (Agent): The Product Owner agent.
+        dependent_tasks (list): Tasks this task depends on, typically PRD and architecture tasks.
+        product_owner_preferences (str, optional): Extracted preferences for the Product Owner.
+        
+    Returns:
+        Task: A CrewAI Task for task list creation.
+    """
+    # Add product owner preferences section if provided
+    po_prefs_section = ""
+    if product_owner_preferences:
+        po_prefs_section = PREFERENCES_TEMPLATE.format(product_owner_preferences=product_owner_preferences)
+    
+    return _new_task(
+        description=DESCRIPTION_TEMPLATE.format(po_prefs_section=po_prefs_section),
         agent=agent,
         depends_on=dependent_tasks
     )
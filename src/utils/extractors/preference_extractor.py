@@ -5,16 +5,124 @@ This module extracts specific preferences and details from product ideas
 to be provided to specific agents in the workflow.
 """
 
-import re
 import logging
+import re
 from typing import Dict, Any, List, Optional, Union
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger("preference_extractor")
+logger.addHandler(logging.NullHandler())
+
+# Patterns are compiled once at import rather than looked up in the re cache
+# on every extraction call
+
+# Business requirement patterns
+_AUDIENCE_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)target\s+(?:audience|users?|customers?)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)(?:audience|users?|customers?)\s+(?:are|include|is)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_GOAL_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:business|primary|main)\s+goals?[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)goals?(?:\s+of\s+the\s+(?:product|project|system))?[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_MARKET_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)market\s+(?:considerations?|needs?|requirements?)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)(?:competitors?|competition)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_METRIC_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:success|key)\s+metrics?[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)(?:measure|measuring)\s+success[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_CONSTRAINT_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)constraints?[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)limitations?[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+
+# Technical preference patterns
+_FRONTEND_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:frontend|front[\s-]end|ui|user\s+interface)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)(?:use|using|prefer)\s+(?:react|angular|vue|svelte)[^\.]*",
+))
+_BACKEND_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:backend|back[\s-]end|server)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)(?:use|using|prefer)\s+(?:node|django|flask|express|spring|rails)[^\.]*",
+))
+_DATABASE_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:database|data\s+storage|db)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)(?:use|using|prefer)\s+(?:sql|mysql|postgresql|mongo|dynamodb|firebase)[^\.]*",
+))
+_INFRA_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:infrastructure|hosting|deployment|cloud)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)(?:use|using|prefer)\s+(?:aws|azure|gcp|kubernetes|docker)[^\.]*",
+))
+_LANGUAGE_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:language|programming\s+language)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)(?:use|using|prefer)\s+(?:python|javascript|typescript|java|c\#|ruby|go)[^\.]*",
+))
+_FRAMEWORK_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:framework|library)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)(?:use|using|prefer)\s+(?:react|angular|vue|django|flask|spring|rails)[^\.]*",
+))
+_API_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:api|integrations?|external\s+services?)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_SECURITY_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:security|authentication|authorization)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_TECH_STACK_PATTERN = re.compile(r"(?i)(?:tech(?:nical)?\s+stack|technologies?)[:\s]+(.*?)(?:\n\n|\n\d|\Z)")
+
+# Project management patterns
+_TIMELINE_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:timeline|schedule|deadline)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)(?:complete|finish|deliver)(?:\s+by|\s+in|\s+within)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_MILESTONE_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:milestone|phase)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_PRIORITY_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:priority|important|critical|key)\s+(?:feature|functionality)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)(?:must\s+have|should\s+have)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_SCOPE_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:scope|extent|boundary)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_REQUIREMENT_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:requirements?|specifications?)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+
+# Scrum patterns
+_STORY_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:user\s+stor(?:y|ies))[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+    r"(?i)(?:as\s+a[n]?\s+.*?I\s+want\s+to[^\.]*)",
+))
+_EPIC_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:epic)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_CRITERIA_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:acceptance\s+criteria|definition\s+of\s+done)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_SPRINT_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:sprint)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_AGILE_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:agile|scrum|kanban)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+
+# Development patterns
+_CODE_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:coding\s+standards?|code\s+style)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_TEST_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:testing|tests?|quality\s+assurance)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_IMPL_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:implementation|development\s+details?)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_PERF_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:performance|speed|efficiency)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
+_ACCESS_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?i)(?:accessibility|a11y)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
+))
 
 def extract_business_requirements(product_idea: str) -> Dict[str, Any]:
     """
@@ -36,53 +144,28 @@ def extract_business_requirements(product_idea: str) -> Dict[str, Any]:
     }
     
     # Extract target audience information
-    audience_patterns = [
-        r"(?i)target\s+(?:audience|users?|customers?)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)(?:audience|users?|customers?)\s+(?:are|include|is)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in audience_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _AUDIENCE_PATTERNS:
+        matches = pattern.findall(product_idea)
         business_info["target_audience"].extend(matches)
     
     # Extract business goals
-    goal_patterns = [
-        r"(?i)(?:business|primary|main)\s+goals?[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)goals?(?:\s+of\s+the\s+(?:product|project|system))?[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in goal_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _GOAL_PATTERNS:
+        matches = pattern.findall(product_idea)
         business_info["business_goals"].extend(matches)
     
     # Extract market considerations
-    market_patterns = [
-        r"(?i)market\s+(?:considerations?|needs?|requirements?)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)(?:competitors?|competition)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in market_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _MARKET_PATTERNS:
+        matches = pattern.findall(product_idea)
         business_info["market_considerations"].extend(matches)
     
     # Extract success metrics
-    metric_patterns = [
-        r"(?i)(?:success|key)\s+metrics?[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)(?:measure|measuring)\s+success[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in metric_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _METRIC_PATTERNS:
+        matches = pattern.findall(product_idea)
         business_info["success_metrics"].extend(matches)
     
     # Extract constraints
-    constraint_patterns = [
-        r"(?i)constraints?[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)limitations?[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in constraint_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _CONSTRAINT_PATTERNS:
+        matches = pattern.findall(product_idea)
         business_info["constraints"].extend(matches)
     
     return business_info
@@ -110,86 +193,47 @@ def extract_technical_preferences(product_idea: str) -> Dict[str, Any]:
     }
     
     # Extract frontend preferences
-    frontend_patterns = [
-        r"(?i)(?:frontend|front[\s-]end|ui|user\s+interface)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)(?:use|using|prefer)\s+(?:react|angular|vue|svelte)[^\.]*",
-    ]
-    
-    for pattern in frontend_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _FRONTEND_PATTERNS:
+        matches = pattern.findall(product_idea)
         tech_preferences["frontend"].extend(matches)
     
     # Extract backend preferences
-    backend_patterns = [
-        r"(?i)(?:backend|back[\s-]end|server)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)(?:use|using|prefer)\s+(?:node|django|flask|express|spring|rails)[^\.]*",
-    ]
-    
-    for pattern in backend_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _BACKEND_PATTERNS:
+        matches = pattern.findall(product_idea)
         tech_preferences["backend"].extend(matches)
     
     # Extract database preferences
-    database_patterns = [
-        r"(?i)(?:database|data\s+storage|db)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)(?:use|using|prefer)\s+(?:sql|mysql|postgresql|mongo|dynamodb|firebase)[^\.]*",
-    ]
-    
-    for pattern in database_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _DATABASE_PATTERNS:
+        matches = pattern.findall(product_idea)
         tech_preferences["database"].extend(matches)
     
     # Extract infrastructure preferences
-    infra_patterns = [
-        r"(?i)(?:infrastructure|hosting|deployment|cloud)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)(?:use|using|prefer)\s+(?:aws|azure|gcp|kubernetes|docker)[^\.]*",
-    ]
-    
-    for pattern in infra_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _INFRA_PATTERNS:
+        matches = pattern.findall(product_idea)
         tech_preferences["infrastructure"].extend(matches)
     
     # Extract programming language preferences
-    language_patterns = [
-        r"(?i)(?:language|programming\s+language)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)(?:use|using|prefer)\s+(?:python|javascript|typescript|java|c\#|ruby|go)[^\.]*",
-    ]
-    
-    for pattern in language_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _LANGUAGE_PATTERNS:
+        matches = pattern.findall(product_idea)
         tech_preferences["languages"].extend(matches)
     
     # Extract framework preferences 
-    framework_patterns = [
-        r"(?i)(?:framework|library)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)(?:use|using|prefer)\s+(?:react|angular|vue|django|flask|spring|rails)[^\.]*",
-    ]
-    
-    for pattern in framework_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _FRAMEWORK_PATTERNS:
+        matches = pattern.findall(product_idea)
         tech_preferences["frameworks"].extend(matches)
     
     # Extract API preferences
-    api_patterns = [
-        r"(?i)(?:api|integrations?|external\s+services?)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in api_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _API_PATTERNS:
+        matches = pattern.findall(product_idea)
         tech_preferences["apis"].extend(matches)
     
     # Extract security preferences
-    security_patterns = [
-        r"(?i)(?:security|authentication|authorization)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in security_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _SECURITY_PATTERNS:
+        matches = pattern.findall(product_idea)
         tech_preferences["security"].extend(matches)
     
     # Look for any "tech stack" sections
-    tech_stack_pattern = r"(?i)(?:tech(?:nical)?\s+stack|technologies?)[:\s]+(.*?)(?:\n\n|\n\d|\Z)"
-    tech_stack_matches = re.findall(tech_stack_pattern, product_idea)
+    tech_stack_matches = _TECH_STACK_PATTERN.findall(product_idea)
     
     for match in tech_stack_matches:
         tech_preferences["other"].append(match)
@@ -215,50 +259,28 @@ def extract_project_management_preferences(product_idea: str) -> Dict[str, Any]:
     }
     
     # Extract timeline information
-    timeline_patterns = [
-        r"(?i)(?:timeline|schedule|deadline)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)(?:complete|finish|deliver)(?:\s+by|\s+in|\s+within)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in timeline_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _TIMELINE_PATTERNS:
+        matches = pattern.findall(product_idea)
         pm_preferences["timeline"].extend(matches)
     
     # Extract milestone information
-    milestone_patterns = [
-        r"(?i)(?:milestone|phase)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in milestone_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _MILESTONE_PATTERNS:
+        matches = pattern.findall(product_idea)
         pm_preferences["milestones"].extend(matches)
     
     # Extract priority feature information
-    priority_patterns = [
-        r"(?i)(?:priority|important|critical|key)\s+(?:feature|functionality)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)(?:must\s+have|should\s+have)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in priority_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _PRIORITY_PATTERNS:
+        matches = pattern.findall(product_idea)
         pm_preferences["priority_features"].extend(matches)
     
     # Extract scope information
-    scope_patterns = [
-        r"(?i)(?:scope|extent|boundary)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in scope_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _SCOPE_PATTERNS:
+        matches = pattern.findall(product_idea)
         pm_preferences["scope"].extend(matches)
     
     # Extract requirements
-    requirement_patterns = [
-        r"(?i)(?:requirements?|specifications?)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in requirement_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _REQUIREMENT_PATTERNS:
+        matches = pattern.findall(product_idea)
         pm_preferences["requirements"].extend(matches)
     
     return pm_preferences
@@ -282,49 +304,28 @@ def extract_scrum_preferences(product_idea: str) -> Dict[str, Any]:
     }
     
     # Extract user story information
-    story_patterns = [
-        r"(?i)(?:user\s+stor(?:y|ies))[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-        r"(?i)(?:as\s+a[n]?\s+.*?I\s+want\s+to[^\.]*)",
-    ]
-    
-    for pattern in story_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _STORY_PATTERNS:
+        matches = pattern.findall(product_idea)
         scrum_preferences["user_stories"].extend(matches)
     
     # Extract epic information
-    epic_patterns = [
-        r"(?i)(?:epic)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in epic_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _EPIC_PATTERNS:
+        matches = pattern.findall(product_idea)
         scrum_preferences["epics"].extend(matches)
     
     # Extract acceptance criteria
-    criteria_patterns = [
-        r"(?i)(?:acceptance\s+criteria|definition\s+of\s+done)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in criteria_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _CRITERIA_PATTERNS:
+        matches = pattern.findall(product_idea)
         scrum_preferences["acceptance_criteria"].extend(matches)
     
     # Extract sprint details
-    sprint_patterns = [
-        r"(?i)(?:sprint)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in sprint_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _SPRINT_PATTERNS:
+        matches = pattern.findall(product_idea)
         scrum_preferences["sprint_details"].extend(matches)
     
     # Extract general agile specifics
-    agile_patterns = [
-        r"(?i)(?:agile|scrum|kanban)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in agile_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _AGILE_PATTERNS:
+        matches = pattern.findall(product_idea)
         scrum_preferences["agile_specifics"].extend(matches)
     
     return scrum_preferences
@@ -348,48 +349,28 @@ def extract_development_preferences(product_idea: str) -> Dict[str, Any]:
     }
     
     # Extract coding standards 
-    code_patterns = [
-        r"(?i)(?:coding\s+standards?|code\s+style)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in code_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _CODE_PATTERNS:
+        matches = pattern.findall(product_idea)
         dev_preferences["coding_standards"].extend(matches)
     
     # Extract testing requirements
-    test_patterns = [
-        r"(?i)(?:testing|tests?|quality\s+assurance)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in test_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _TEST_PATTERNS:
+        matches = pattern.findall(product_idea)
         dev_preferences["testing_requirements"].extend(matches)
     
     # Extract implementation details
-    impl_patterns = [
-        r"(?i)(?:implementation|development\s+details?)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in impl_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _IMPL_PATTERNS:
+        matches = pattern.findall(product_idea)
         dev_preferences["implementation_details"].extend(matches)
     
     # Extract performance requirements
-    perf_patterns = [
-        r"(?i)(?:performance|speed|efficiency)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in perf_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _PERF_PATTERNS:
+        matches = pattern.findall(product_idea)
         dev_preferences["performance_requirements"].extend(matches)
     
     # Extract accessibility requirements
-    access_patterns = [
-        r"(?i)(?:accessibility|a11y)[:\s]+(.*?)(?:\n\n|\n\d|\Z)",
-    ]
-    
-    for pattern in access_patterns:
-        matches = re.findall(pattern, product_idea)
+    for pattern in _ACCESS_PATTERNS:
+        matches = pattern.findall(product_idea)
         dev_preferences["accessibility_requirements"].extend(matches)
     
     return dev_preferences
@@ -412,6 +393,15 @@ def extract_all_preferences(product_idea: str) -> Dict[str, Dict[str, Any]]:
         "development": extract_development_preferences(product_idea)
     }
 
+# Preference category and section heading for each agent type
+_AGENT_PREFERENCE_SECTIONS = {
+    "business_analyst": ("business", "Extracted Business Requirements"),
+    "architect": ("technical", "Technical Preferences"),
+    "project_manager": ("project_management", "Project Management Considerations"),
+    "scrum_master": ("scrum", "Scrum and User Story Preferences"),
+    "developer": ("development", "Development Preferences"),
+}
+
 def format_preferences_for_agent(preferences: Dict[str, Any], agent_type: str) -> str:
     """
     Format preferences in a way suitable for inclusion in task descriptions.
@@ -423,61 +413,19 @@ def format_preferences_for_agent(preferences: Dict[str, Any], agent_type: str) -
     Returns:
         Formatted string of preferences
     """
-    formatted_text = ""
-    
-    if agent_type == "business_analyst":
-        relevant_prefs = preferences.get("business", {})
-        formatted_text += "Extracted Business Requirements:\n\n"
-        
-        for category, items in relevant_prefs.items():
-            if items:
-                formatted_text += f"- {category.replace('_', ' ').title()}:\n"
-                for item in items:
-                    formatted_text += f"  - {item.strip()}\n"
-                formatted_text += "\n"
-    
-    elif agent_type == "architect":
-        relevant_prefs = preferences.get("technical", {})
-        formatted_text += "Technical Preferences:\n\n"
-        
-        for category, items in relevant_prefs.items():
-            if items:
-                formatted_text += f"- {category.replace('_', ' ').title()}:\n"
-                for item in items:
-                    formatted_text += f"  - {item.strip()}\n"
-                formatted_text += "\n"
-    
-    elif agent_type == "project_manager":
-        relevant_prefs = preferences.get("project_management", {})
-        formatted_text += "Project Management Considerations:\n\n"
-        
-        for category, items in relevant_prefs.items():
-            if items:
-                formatted_text += f"- {category.replace('_', ' ').title()}:\n"
-                for item in items:
-                    formatted_text += f"  - {item.strip()}\n"
-                formatted_text += "\n"
-    
-    elif agent_type == "scrum_master":
-        relevant_prefs = preferences.get("scrum", {})
-        formatted_text += "Scrum and User Story Preferences:\n\n"
-        
-        for category, items in relevant_prefs.items():
-            if items:
-                formatted_text += f"- {category.replace('_', ' ').title()}:\n"
-                for item in items:
-                    formatted_text += f"  - {item.strip()}\n"
-                formatted_text += "\n"
+    parts: List[str] = []
     
-    elif agent_type == "developer":
-        relevant_prefs = preferences.get("development", {})
-        formatted_text += "Development Preferences:\n\n"
+    if agent_type in _AGENT_PREFERENCE_SECTIONS:
+        preference_key, heading = _AGENT_PREFERENCE_SECTIONS[agent_type]
+        relevant_prefs = preferences.get(preference_key, {})
+        parts.append(f"{heading}:\n\n")
         
         for category, items in relevant_prefs.items():
             if items:
-                formatted_text += f"- {category.replace('_', ' ').title()}:\n"
+                parts.append(f"- {category.replace('_', ' ').title()}:\n")
                 for item in items:
-                    formatted_text += f"  - {item.strip()}\n"
-                formatted_text += "\n"
+                    parts.append(f"  - {item.strip()}\n")
+                parts.append("\n")
     
+    formatted_text = "".join(parts)
     return formatted_text if formatted_text else "No specific preferences found."
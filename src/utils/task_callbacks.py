@@ -9,12 +9,12 @@ import logging
 from typing import Dict, Any, List, Optional, Union, Callable
 import inspect
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger("task_callbacks")
+logger.addHandler(logging.NullHandler())
+
+# Attributes checked, in order, for the text of a task output
+_OUTPUT_ATTRS = ('raw_output', 'output', 'result', 'response', 'content')
+_MISSING = object()
 
 class ImmediateArtifactCallback:
     """
@@ -25,7 +25,7 @@ class ImmediateArtifactCallback:
     the entire workflow to finish.
     """
     
-    def __init__(self, task, artifact_service, artifact_type, stage_name, jira_connector=None, with_jira=False):
+    def __init__(self, task, artifact_service, artifact_type, stage_name, jira_connector=None, with_jira=False, verbose=True):
         """
         Initialize the immediate artifact callback.
         
@@ -36,6 +36,7 @@ class ImmediateArtifactCallback:
             stage_name: Name of the workflow stage
             jira_connector: Optional connector for JIRA integration
             with_jira: Whether JIRA integration is enabled
+            verbose: Whether to echo save progress to stdout in addition to the log
         """
         self.task = task
         self.artifact_service = artifact_service
@@ -43,6 +44,7 @@ class ImmediateArtifactCallback:
         self.stage_name = stage_name
         self.jira_connector = jira_connector
         self.with_jira = with_jira
+        self.verbose = verbose
     
     def __call__(self, task_output):
         """
@@ -64,7 +66,8 @@ class ImmediateArtifactCallback:
                 # Save the artifact
                 filepath = self.artifact_service.save_artifact(self.artifact_type, content)
                 logger.info(f"Saved '{self.stage_name}' artifact to {filepath}")
-                print(f"✅ Saved artifact for '{self.stage_name}'")
+                if self.verbose:
+                    print(f"✅ Saved artifact for '{self.stage_name}'")
                 
                 # Special handling for JIRA if needed
                 if (self.with_jira and 
@@ -75,19 +78,23 @@ class ImmediateArtifactCallback:
                         results = self.jira_connector.create_epics_and_stories(content)
                         if results.get("success"):
                             logger.info(
-                                f"Created {len(results.get('epics', []))} epics and "
-                                f"{len(results.get('stories', []))} stories in JIRA"
+                                f"Created {results.get('n_epics', 0)} epics and "
+                                f"{results.get('n_stories', 0)} stories in JIRA"
                             )
-                            print(f"✅ Created JIRA items from '{self.stage_name}' output")
+                            if self.verbose:
+                                print(f"✅ Created JIRA items from '{self.stage_name}' output")
                         else:
                             logger.warning(f"Failed to create JIRA items: {results.get('error')}")
-                            print(f"❌ Failed to create JIRA items: {results.get('error')}")
+                            if self.verbose:
+                                print(f"❌ Failed to create JIRA items: {results.get('error')}")
                     except Exception as e:
                         logger.error(f"Error creating JIRA items: {e}")
-                        print(f"❌ Error creating JIRA items: {e}")
+                        if self.verbose:
+                            print(f"❌ Error creating JIRA items: {e}")
             except Exception as e:
                 logger.error(f"Error saving artifact for '{self.stage_name}': {e}")
-                print(f"❌ Failed to save artifact for '{self.stage_name}': {e}")
+                if self.verbose:
+                    print(f"❌ Failed to save artifact for '{self.stage_name}': {e}")
         
         # Return the original output to allow callback chaining
         return task_output
@@ -114,46 +121,13 @@ class ImmediateArtifactCallback:
                 logger.info("Task output is already a string")
                 return task_output
             
-            # Handle different attributes - avoid recursion
-            if hasattr(task_output, 'raw_output'):
-                raw_output = task_output.raw_output
-                logger.info("Extracted content from raw_output attribute")
-                if isinstance(raw_output, str):
-                    return raw_output
-                else:
-                    return str(raw_output)
-            
-            elif hasattr(task_output, 'output'):
-                output_attr = task_output.output
-                logger.info("Extracted content from output attribute")
-                if isinstance(output_attr, str):
-                    return output_attr
-                else:
-                    return str(output_attr)
-            
-            elif hasattr(task_output, 'result'):
-                result = task_output.result
-                logger.info("Extracted content from result attribute")
-                if isinstance(result, str):
-                    return result
-                else:
-                    return str(result)
-            
-            elif hasattr(task_output, 'response'):
-                response = task_output.response
-                logger.info("Extracted content from response attribute")
-                if isinstance(response, str):
-                    return response
-                else:
-                    return str(response)
-            
-            elif hasattr(task_output, 'content'):
-                content_attr = task_output.content
-                logger.info("Extracted content from content attribute")
-                if isinstance(content_attr, str):
-                    return content_attr
-                else:
-                    return str(content_attr)
+            # Handle different attributes - avoid recursion. A single
+            # getattr per attribute replaces the hasattr-then-access pair
+            for attr in _OUTPUT_ATTRS:
+                value = getattr(task_output, attr, _MISSING)
+                if value is not _MISSING:
+                    logger.info(f"Extracted content from {attr} attribute")
+                    return value if isinstance(value, str) else str(value)
             
             # Try string conversion
             content = str(task_output)
@@ -165,7 +139,7 @@ class ImmediateArtifactCallback:
             logger.error(f"Error extracting content from task output: {e}")
             return f"Error extracting content from task output: {e}"
 
-def create_callbacks_for_tasks(tasks, artifact_service, jira_connector=None, with_jira=False):
+def create_callbacks_for_tasks(tasks, artifact_service, jira_connector=None, with_jira=False, verbose=True):
     """
     Create and attach immediate artifact saving callbacks for a list of tasks.
     
@@ -174,6 +148,7 @@ def create_callbacks_for_tasks(tasks, artifact_service, jira_connector=None, wit
         artifact_service: Service for saving artifacts
         jira_connector: Optional connector for JIRA integration
         with_jira: Whether JIRA integration is enabled
+        verbose: Whether callbacks echo save progress to stdout
         
     Returns:
         List of tasks with callbacks attached
@@ -195,7 +170,8 @@ def create_callbacks_for_tasks(tasks, artifact_service, jira_connector=None, wit
             artifact_type=artifact_type,
             stage_name=stage_name,
             jira_connector=jira_connector,
-            with_jira=with_jira
+            with_jira=with_jira,
+            verbose=verbose
         )
         
         # Try different methods to attach the callback
@@ -7,6 +7,7 @@ from typing import Dict, Any, List, Optional, Callable
 from crewai import Task
 
 logger = logging.getLogger("task_observer")
+logger.addHandler(logging.NullHandler())
 
 class TaskWrapper:
     """
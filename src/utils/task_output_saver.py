@@ -7,9 +7,15 @@ directly monitors task outputs and saves them as artifacts.
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger("task_output_saver")
+logger.addHandler(logging.NullHandler())
+
+# Attributes checked, in order, for the text of a task output
+_OUTPUT_ATTRS = ('raw_output', 'output', 'result', 'response', 'content', 'text')
+_MISSING = object()
 
 class TaskOutputSaver:
     """
@@ -19,7 +25,7 @@ class TaskOutputSaver:
     rather than through callbacks, which can be unreliable.
     """
     
-    def __init__(self, artifact_service=None, jira_connector=None, with_jira=False):
+    def __init__(self, artifact_service=None, jira_connector=None, with_jira=False, verbose=True):
         """
         Initialize the task output saver.
         
@@ -27,10 +33,14 @@ class TaskOutputSaver:
             artifact_service: The artifact service to use for saving artifacts
             jira_connector: Optional JIRA connector for JIRA integration
             with_jira: Whether JIRA integration is enabled
+            verbose: Whether to echo save progress to stdout in addition to the log
         """
         self.artifact_service = artifact_service
         self.jira_connector = jira_connector
         self.with_jira = with_jira
+        self.verbose = verbose
+        # Created on first JIRA publish so runs without JIRA start no thread
+        self._jira_pool = None
         
         # Map of task descriptions to artifact types
         self.task_to_artifact_map = {}
@@ -81,58 +91,17 @@ class TaskOutputSaver:
             if isinstance(output, str):
                 return output
             
-            # Handle CrewAI task output objects - avoid recursion
-            if hasattr(output, 'raw_output'):
-                raw_output = output.raw_output
-                if isinstance(raw_output, str):
-                    return raw_output
-                else:
-                    return str(raw_output)
-            
-            if hasattr(output, 'output'):
-                output_attr = output.output
-                if isinstance(output_attr, str):
-                    return output_attr
-                else:
-                    return str(output_attr)
-            
-            if hasattr(output, 'result'):
-                result = output.result
-                if isinstance(result, str):
-                    return result
-                else:
-                    return str(result)
-            
-            if hasattr(output, 'response'):
-                response = output.response
-                if isinstance(response, str):
-                    return response
-                else:
-                    return str(response)
-            
-            if hasattr(output, 'content'):
-                content = output.content
-                if isinstance(content, str):
-                    return content
-                else:
-                    return str(content)
-            
-            if hasattr(output, 'text'):
-                text = output.text
-                if isinstance(text, str):
-                    return text
-                else:
-                    return str(text)
+            # Handle CrewAI task output objects - avoid recursion. A single
+            # getattr per attribute replaces the hasattr-then-access pair
+            for attr in _OUTPUT_ATTRS:
+                value = getattr(output, attr, _MISSING)
+                if value is not _MISSING:
+                    return value if isinstance(value, str) else str(value)
             
             # Check for task object - avoid recursion
-            if hasattr(output, 'task'):
-                task = output.task
-                if hasattr(task, 'output') and task.output is not None:
-                    task_output = task.output
-                    if isinstance(task_output, str):
-                        return task_output
-                    else:
-                        return str(task_output)
+            task_output = getattr(getattr(output, 'task', None), 'output', None)
+            if task_output is not None:
+                return task_output if isinstance(task_output, str) else str(task_output)
             
             # For objects that have a usable string representation
             return str(output)
@@ -166,7 +135,8 @@ class TaskOutputSaver:
         
         try:
             logger.info(f"Saving output for task: {task_name}")
-            print(f"\nSaving artifact for {task_name}: {artifact_type}")
+            if self.verbose:
+                print(f"\nSaving artifact for {task_name}: {artifact_type}")
             
             # Extract content from the output
             content = self._extract_content(output)
@@ -174,6 +144,15 @@ class TaskOutputSaver:
                 logger.warning(f"Empty content extracted for task: {task_name}")
                 content = f"Empty content for {task_name}"
             
+            # Start the JIRA publish before saving so the two overlap; JIRA
+            # works from the content, not from the saved file
+            jira_future = None
+            if self.with_jira and self.jira_connector and artifact_type == "JIRA epics and stories":
+                logger.info("Creating JIRA epics and stories...")
+                if self._jira_pool is None:
+                    self._jira_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jira")
+                jira_future = self._jira_pool.submit(self.jira_connector.create_epics_and_stories, content)
+            
             # Save the artifact using the artifact service
             filepath = None
             if self.artifact_service:
@@ -181,18 +160,19 @@ class TaskOutputSaver:
                 
                 if filepath:
                     logger.info(f"Artifact saved to: {filepath}")
-                    print(f"Artifact saved to: {filepath}")
+                    if self.verbose:
+                        print(f"Artifact saved to: {filepath}")
                 else:
                     logger.warning("Failed to save artifact")
-                    print("Failed to save artifact")
+                    if self.verbose:
+                        print("Failed to save artifact")
                 
                 # Handle JIRA integration if needed
-                if self.with_jira and self.jira_connector and artifact_type == "JIRA epics and stories":
+                if jira_future is not None:
                     try:
-                        logger.info("Creating JIRA epics and stories...")
-                        results = self.jira_connector.create_epics_and_stories(content)
+                        results = jira_future.result()
                         if results["success"]:
-                            logger.info(f"Created {len(results.get('epics', []))} epics and {len(results.get('stories', []))} stories in JIRA")
+                            logger.info(f"Created {results.get('n_epics', 0)} epics and {results.get('n_stories', 0)} stories in JIRA")
                         else:
                             logger.warning(f"Failed to create JIRA items: {results.get('error', 'Unknown error')}")
                     except Exception as e:
@@ -202,6 +182,13 @@ class TaskOutputSaver:
             
         except Exception as e:
             logger.error(f"Error saving artifact: {e}")
-            print(f"Error saving artifact: {e}")
+            if self.verbose:
+                print(f"Error saving artifact: {e}")
         
         return None
+    
+    def close(self):
+        """Shut down the JIRA publishing thread, waiting for a pending publish"""
+        if self._jira_pool is not None:
+            self._jira_pool.shutdown(wait=True)
+            self._jira_pool = None
@@ -2,10 +2,16 @@
 Unit tests for the ArtifactManager class.
 """
 
+import asyncio
+import gc
 import unittest
 import os
 import shutil
+import stat
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
+import src.artifacts.manager as manager_module
 from src.artifacts.manager import ArtifactManager
 
 class TestArtifactManager(unittest.TestCase):
@@ -62,6 +68,16 @@ class TestArtifactManager(unittest.TestCase):
         name = "First Line\nSecond Line\nThird Line"
         expected = "first_line"
         self.assertEqual(self.manager.sanitize_directory_name(name), expected)
+        
+        # Test with dashes and mixed whitespace
+        name = "Task - Manager\tPro"
+        expected = "task_manager_pro"
+        self.assertEqual(self.manager.sanitize_directory_name(name), expected)
+        
+        # Test with non-ASCII characters
+        name = "Café Finder!"
+        expected = "café_finder"
+        self.assertEqual(self.manager.sanitize_directory_name(name), expected)
     
     def test_create_project_directory(self):
         """Test project directory creation."""
@@ -88,6 +104,66 @@ class TestArtifactManager(unittest.TestCase):
         
         self.assertEqual(saved_content, content)
     
+    def test_save_artifact_failed_write_keeps_previous_content(self):
+        """Test that a failed write leaves the existing artifact intact."""
+        filepath = self.manager.save_artifact(self.product_name, "requirements", "Original content")
+        
+        with patch('src.artifacts.manager.os.write', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.manager.save_artifact(self.product_name, "requirements", "New content")
+        
+        with open(filepath, 'r') as f:
+            self.assertEqual(f.read(), "Original content")
+        self.assertFalse(os.path.exists(filepath + ".tmp"))
+    
+    def test_save_artifact_file_mode(self):
+        """Test that saved files get the umask-based mode and keep an existing one."""
+        filepath = self.manager.save_artifact(self.product_name, "requirements", "Requirements content")
+        
+        expected_mode = 0o666 & ~manager_module._UMASK
+        self.assertEqual(stat.S_IMODE(os.stat(filepath).st_mode), expected_mode)
+        
+        os.chmod(filepath, 0o664)
+        self.manager.save_artifact(self.product_name, "requirements", "Updated content")
+        self.assertEqual(stat.S_IMODE(os.stat(filepath).st_mode), 0o664)
+    
+    def test_write_fsyncs_before_replace(self):
+        """Test that artifact data is fsynced before it is renamed into place."""
+        calls = MagicMock()
+        with patch('src.artifacts.manager.os.fsync', side_effect=lambda fd: calls.fsync()), \
+             patch('src.artifacts.manager.os.replace', side_effect=lambda src, dst: calls.replace()):
+            self.manager.save_artifact(self.product_name, "requirements", "Requirements content")
+        
+        self.assertEqual([c[0] for c in calls.mock_calls][:2], ["fsync", "replace"])
+    
+    def test_concurrent_saves_to_same_file(self):
+        """Test that concurrent saves mapping to the same file all succeed."""
+        # "custom type" and "custom-type" both map to custom_type.md
+        items = [("custom type", "A" * 100000), ("custom-type", "B" * 100000)] * 10
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            filepaths = list(pool.map(
+                lambda item: self.manager.save_artifact(self.product_name, *item), items
+            ))
+        
+        expected_path = os.path.join(self.test_base_dir, self.expected_dir_name, "custom_type.md")
+        self.assertEqual(filepaths, [expected_path] * len(items))
+        with open(expected_path, 'r') as f:
+            self.assertIn(f.read(), ("A" * 100000, "B" * 100000))
+        self.assertEqual(os.listdir(os.path.dirname(expected_path)), ["custom_type.md"])
+    
+    def test_save_artifact_async(self):
+        """Test saving an artifact through the async API."""
+        content = "Async content for requirements"
+        
+        filepath = asyncio.run(
+            self.manager.save_artifact_async(self.product_name, "requirements", content)
+        )
+        expected_path = os.path.join(self.test_base_dir, self.expected_dir_name, "business_requirements.md")
+        
+        self.assertEqual(filepath, expected_path)
+        with open(filepath, 'r') as f:
+            self.assertEqual(f.read(), content)
+    
     def test_save_artifact_unknown_type(self):
         """Test saving an artifact with unknown type."""
         artifact_type = "custom_type"
@@ -120,6 +196,76 @@ class TestArtifactManager(unittest.TestCase):
         self.assertTrue(any("business_requirements.md" in a for a in artifacts))
         self.assertTrue(any("prd_document.md" in a for a in artifacts))
     
+    def test_artifact_index_persists(self):
+        """Test that saved artifact paths survive a manager restart."""
+        filepath = self.manager.save_artifact(self.product_name, "requirements", "Requirements content")
+        self.manager.close()
+        
+        self.assertTrue(os.path.exists(os.path.join(self.test_base_dir, ArtifactManager.INDEX_FILENAME)))
+        
+        reloaded = ArtifactManager(base_dir=self.test_base_dir)
+        self.assertEqual(reloaded.get_artifact_path(self.product_name, "requirements"), filepath)
+    
+    def test_list_artifacts_includes_unflushed_saves(self):
+        """Test that artifacts saved after the last index flush are still listed."""
+        requirements_path = self.manager.save_artifact(self.product_name, "requirements", "Requirements content")
+        self.manager.close()
+        # Simulate the process dying before the index is flushed again
+        prd_path = self.manager.save_artifact(self.product_name, "PRD document", "PRD content")
+        
+        reloaded = ArtifactManager(base_dir=self.test_base_dir)
+        self.assertEqual(
+            sorted(reloaded.list_artifacts(self.product_name)),
+            sorted([requirements_path, prd_path])
+        )
+    
+    def test_list_artifacts_unindexed_directory(self):
+        """Test listing a project directory whose files were never indexed."""
+        project_dir = os.path.join(self.test_base_dir, self.expected_dir_name)
+        code_dir = os.path.join(project_dir, "implementation_code")
+        os.makedirs(code_dir)
+        with open(os.path.join(project_dir, "task_list.md"), "w") as f:
+            f.write("Tasks")
+        with open(os.path.join(code_dir, "app.py"), "w") as f:
+            f.write("print('hi')")
+        
+        artifacts = self.manager.list_artifacts(self.product_name)
+        
+        self.assertEqual(
+            sorted(artifacts),
+            sorted([os.path.join(project_dir, "task_list.md"), os.path.join(code_dir, "app.py")])
+        )
+    
+    def test_artifact_index_drops_missing_files(self):
+        """Test that index entries for deleted artifacts are discarded on load."""
+        filepath = self.manager.save_artifact(self.product_name, "requirements", "Requirements content")
+        self.manager.close()
+        os.remove(filepath)
+        
+        reloaded = ArtifactManager(base_dir=self.test_base_dir)
+        self.assertEqual(reloaded.list_artifacts(self.product_name), [])
+    
+    def test_malformed_artifact_index_is_ignored(self):
+        """Test that a well-formed index of the wrong shape is ignored on load."""
+        index_path = os.path.join(self.test_base_dir, ArtifactManager.INDEX_FILENAME)
+        for raw_index in ("[]", '{"Test Product Idea": "not a dict"}'):
+            with open(index_path, "w") as f:
+                f.write(raw_index)
+            
+            reloaded = ArtifactManager(base_dir=self.test_base_dir)
+            
+            self.assertEqual(reloaded._index, {})
+    
+    def test_manager_not_kept_alive_for_exit_flush(self):
+        """Test that registering for the exit flush doesn't keep a manager alive."""
+        manager = ArtifactManager(base_dir=self.test_base_dir)
+        manager_ref = weakref.ref(manager)
+        
+        del manager
+        gc.collect()
+        
+        self.assertIsNone(manager_ref())
+    
     def test_read_artifact(self):
         """Test reading an artifact."""
         artifact_type = "requirements"
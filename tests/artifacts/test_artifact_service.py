@@ -55,6 +55,30 @@ class TestArtifactService(unittest.TestCase):
         # Check that the returned filepath is correct
         self.assertEqual(filepath, "/path/to/artifact.md")
     
+    def test_save_artifacts_bulk(self):
+        """Test saving several artifacts at once."""
+        self.mock_manager.save_artifact.side_effect = lambda name, artifact_type, content: f"/path/{artifact_type}.md"
+        items = [("requirements", "Requirements"), ("PRD document", "PRD"), ("task list", "Tasks")]
+        
+        filepaths = self.service.save_artifacts_bulk(items)
+        
+        self.assertEqual(filepaths, ["/path/requirements.md", "/path/PRD document.md", "/path/task list.md"])
+        self.assertEqual(self.mock_manager.save_artifact.call_count, 3)
+        self.service.close()
+        self.assertIsNone(self.service._pool)
+    
+    def test_pool_created_on_first_bulk_save(self):
+        """Test that the bulk-save pool is only created when first needed."""
+        self.assertIsNone(self.service._pool)
+        self.service.save_artifact("requirements", "Requirements")
+        self.assertIsNone(self.service._pool)
+        
+        self.service.save_artifacts_bulk([("requirements", "Requirements")])
+        self.assertIsNotNone(self.service._pool)
+        
+        self.service.close()
+        self.assertIsNone(self.service._pool)
+    
     def test_save_artifact_no_manager(self):
         """Test saving artifact without manager."""
         service = ArtifactService()
@@ -0,0 +1,105 @@
+"""
+Unit tests for the JiraConnector class.
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+import src.artifacts.jira_connector as jira_connector_module
+from src.artifacts.jira_connector import JiraConnector, get_jira_connector
+
+JIRA_ENV = {
+    "JIRA_URL": "https://example.atlassian.net",
+    "JIRA_EMAIL": "user@example.com",
+    "JIRA_API_TOKEN": "token",
+    "JIRA_PROJECT_KEY": "AAC",
+}
+
+class TestJiraConnector(unittest.TestCase):
+    """Test cases for the JiraConnector class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.env_patcher = patch.dict(os.environ, JIRA_ENV)
+        self.env_patcher.start()
+        
+        # Stand-ins for the jira and requests packages imported inside connect()
+        self.mock_client = MagicMock()
+        self.mock_client.myself.return_value = {"displayName": "Test User"}
+        self.jira_module = MagicMock()
+        self.jira_module.JIRA.return_value = self.mock_client
+        requests_module = MagicMock()
+        self.modules_patcher = patch.dict(sys.modules, {
+            "jira": self.jira_module,
+            "requests": requests_module,
+            "requests.adapters": requests_module.adapters,
+        })
+        self.modules_patcher.start()
+        
+        self.original_connector = jira_connector_module._jira_connector
+        jira_connector_module._jira_connector = None
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        jira_connector_module._jira_connector = self.original_connector
+        self.modules_patcher.stop()
+        self.env_patcher.stop()
+    
+    def test_connect_reuses_client(self):
+        """Test that repeated connects build the client and call myself() once."""
+        connector = JiraConnector()
+        
+        self.assertTrue(connector.connect())
+        self.assertTrue(connector.connect())
+        
+        self.jira_module.JIRA.assert_called_once()
+        self.mock_client.myself.assert_called_once()
+        self.assertIs(connector.jira_client, self.mock_client)
+    
+    def test_connect_failure_leaves_client_unset(self):
+        """Test that a failed connection check does not keep the client."""
+        self.mock_client.myself.side_effect = Exception("401 Unauthorized")
+        connector = JiraConnector()
+        
+        self.assertFalse(connector.connect())
+        self.assertIsNone(connector.jira_client)
+        
+        # The next attempt tries again rather than reusing the broken client
+        self.mock_client.myself.side_effect = None
+        self.assertTrue(connector.connect())
+        self.assertEqual(self.jira_module.JIRA.call_count, 2)
+    
+    def test_connect_incomplete_configuration(self):
+        """Test that connect fails without creating a client when config is missing."""
+        with patch.dict(os.environ, {"JIRA_API_TOKEN": ""}):
+            connector = JiraConnector()
+        
+        self.assertFalse(connector.connect())
+        self.jira_module.JIRA.assert_not_called()
+        self.assertIsNone(connector.jira_client)
+    
+    def test_create_epics_and_stories_connect_failure(self):
+        """Test that creating JIRA items reports a failed connection."""
+        self.mock_client.myself.side_effect = Exception("401 Unauthorized")
+        connector = JiraConnector()
+        
+        results = connector.create_epics_and_stories("Epics content")
+        
+        self.assertFalse(results["success"])
+        self.assertEqual(results["error"], "Failed to connect to JIRA")
+    
+    def test_get_jira_connector_singleton(self):
+        """Test that get_jira_connector returns one shared connector."""
+        connector = get_jira_connector()
+        
+        self.assertIsInstance(connector, JiraConnector)
+        self.assertIs(get_jira_connector(), connector)
+        
+        connector.connect()
+        get_jira_connector().connect()
+        self.mock_client.myself.assert_called_once()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -198,4 +198,9 @@ class TestMainIntegration(TestMainIntegrationBase):
             
             # Verify task output saver was used
             mock_saver.register_tasks.assert_called_once()
-            self.assertGreaterEqual(mock_saver.save_output.call_count, 1)
\ No newline at end of file
+            self.assertGreaterEqual(mock_saver.save_output.call_count, 1)
+            
+            # Verify main finished the saving step and returned the crew result
+            mock_saver.close.assert_called_once()
+            mock_service.close.assert_called_once()
+            self.assertIs(result, mock_crew)
\ No newline at end of file
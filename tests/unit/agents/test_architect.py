@@ -29,7 +29,7 @@ def test_create_architect_without_tools():
     # Arrange
     agent_mock = MagicMock()
     
-    with patch('src.agents.architect.Agent', return_value=agent_mock) as mock_agent_class:
+    with patch('crewai.Agent', return_value=agent_mock) as mock_agent_class:
         with patch('src.agents.architect.ChatOpenAI') as mock_chat_openai:
             # Act
             agent = create_architect()
@@ -56,7 +56,7 @@ def test_create_architect_with_tools():
     agent_mock = MagicMock()
     tools = [MagicMock(), MagicMock()]
     
-    with patch('src.agents.architect.Agent', return_value=agent_mock) as mock_agent_class:
+    with patch('crewai.Agent', return_value=agent_mock) as mock_agent_class:
         with patch('src.agents.architect.ChatOpenAI'):
             # Act
             agent = create_architect(tools=tools)
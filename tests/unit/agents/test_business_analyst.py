@@ -29,7 +29,7 @@ def test_create_business_analyst_without_tools():
     # Arrange
     agent_mock = MagicMock()
     
-    with patch('src.agents.business_analyst.Agent', return_value=agent_mock) as mock_agent_class:
+    with patch('crewai.Agent', return_value=agent_mock) as mock_agent_class:
         # Act
         agent = create_business_analyst()
         
@@ -50,7 +50,7 @@ def test_create_business_analyst_with_tools():
     agent_mock = MagicMock()
     tools = [MagicMock(), MagicMock()]
     
-    with patch('src.agents.business_analyst.Agent', return_value=agent_mock) as mock_agent_class:
+    with patch('crewai.Agent', return_value=agent_mock) as mock_agent_class:
         # Act
         agent = create_business_analyst(tools=tools)
         
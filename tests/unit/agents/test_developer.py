@@ -29,7 +29,7 @@ def test_create_developer_without_tools():
     # Arrange
     agent_mock = MagicMock()
     
-    with patch('src.agents.developer.Agent', return_value=agent_mock) as mock_agent_class:
+    with patch('crewai.Agent', return_value=agent_mock) as mock_agent_class:
         with patch('src.agents.developer.ChatOpenAI') as mock_chat_openai:
             # Act
             agent = create_developer()
@@ -56,7 +56,7 @@ def test_create_developer_with_tools():
     agent_mock = MagicMock()
     tools = [MagicMock(), MagicMock()]
     
-    with patch('src.agents.developer.Agent', return_value=agent_mock) as mock_agent_class:
+    with patch('crewai.Agent', return_value=agent_mock) as mock_agent_class:
         with patch('src.agents.developer.ChatOpenAI'):
             # Act
             agent = create_developer(tools=tools)
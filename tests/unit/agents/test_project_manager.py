@@ -29,7 +29,7 @@ def test_create_project_manager_without_tools():
     # Arrange
     agent_mock = MagicMock()
     
-    with patch('src.agents.project_manager.Agent', return_value=agent_mock) as mock_agent_class:
+    with patch('crewai.Agent', return_value=agent_mock) as mock_agent_class:
         # Act
         agent = create_project_manager()
         
@@ -50,7 +50,7 @@ def test_create_project_manager_with_tools():
     agent_mock = MagicMock()
     tools = [MagicMock(), MagicMock()]
     
-    with patch('src.agents.project_manager.Agent', return_value=agent_mock) as mock_agent_class:
+    with patch('crewai.Agent', return_value=agent_mock) as mock_agent_class:
         # Act
         agent = create_project_manager(tools=tools)
         
@@ -29,7 +29,7 @@ def test_create_scrum_master_without_tools():
     # Arrange
     agent_mock = MagicMock()
     
-    with patch('src.agents.scrum_master.Agent', return_value=agent_mock) as mock_agent_class:
+    with patch('crewai.Agent', return_value=agent_mock) as mock_agent_class:
         # Act
         agent = create_scrum_master()
         
@@ -51,7 +51,7 @@ def test_create_scrum_master_with_tools():
     agent_mock = MagicMock()
     tools = [MagicMock(), MagicMock()]
     
-    with patch('src.agents.scrum_master.Agent', return_value=agent_mock) as mock_agent_class:
+    with patch('crewai.Agent', return_value=agent_mock) as mock_agent_class:
         # Act
         agent = create_scrum_master(tools=tools)
         
@@ -0,0 +1,99 @@
+"""
+Unit tests for the TaskOutputSaver class.
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from src.utils.task_output_saver import TaskOutputSaver
+
+class TestTaskOutputSaver(unittest.TestCase):
+    """Test cases for the TaskOutputSaver class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.artifact_service = MagicMock()
+        self.artifact_service.save_artifact.return_value = "/path/to/jira_stories.md"
+        self.jira_connector = MagicMock()
+        self.jira_connector.create_epics_and_stories.return_value = {
+            "success": True, "n_epics": 2, "n_stories": 5, "created_keys": []
+        }
+        
+        self.saver = TaskOutputSaver(
+            artifact_service=self.artifact_service,
+            jira_connector=self.jira_connector,
+            with_jira=True,
+            verbose=False
+        )
+        self.saver.register_task("jira task", "JIRA epics and stories", "Story Creation")
+        self.saver.register_task("prd task", "PRD document", "PRD Creation")
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        self.saver.close()
+    
+    def test_save_output_collects_jira_result_after_save(self):
+        """Test that the JIRA publish overlaps the save and its result is collected."""
+        publish_started = threading.Event()
+        release_publish = threading.Event()
+        
+        def publish(content):
+            publish_started.set()
+            release_publish.wait(5)
+            return {"success": True, "n_epics": 2, "n_stories": 5, "created_keys": []}
+        
+        def save(artifact_type, content):
+            # The publish is already running while the artifact is saved
+            self.assertTrue(publish_started.wait(5))
+            release_publish.set()
+            return "/path/to/jira_stories.md"
+        
+        self.jira_connector.create_epics_and_stories.side_effect = publish
+        self.artifact_service.save_artifact.side_effect = save
+        
+        with patch('src.utils.task_output_saver.logger') as mock_logger:
+            filepath = self.saver.save_output("jira task", "Epics content")
+        
+        self.assertEqual(filepath, "/path/to/jira_stories.md")
+        self.jira_connector.create_epics_and_stories.assert_called_once_with("Epics content")
+        mock_logger.info.assert_any_call("Created 2 epics and 5 stories in JIRA")
+    
+    def test_save_output_logs_jira_error(self):
+        """Test that a failing JIRA publish is logged rather than raised."""
+        self.jira_connector.create_epics_and_stories.side_effect = RuntimeError("JIRA down")
+        
+        with patch('src.utils.task_output_saver.logger') as mock_logger:
+            filepath = self.saver.save_output("jira task", "Epics content")
+        
+        self.assertEqual(filepath, "/path/to/jira_stories.md")
+        mock_logger.error.assert_called_once_with("Error creating JIRA items: JIRA down")
+    
+    def test_no_pool_without_jira(self):
+        """Test that no JIRA thread is started when JIRA is not used."""
+        saver = TaskOutputSaver(artifact_service=self.artifact_service, verbose=False)
+        saver.register_task("jira task", "JIRA epics and stories", "Story Creation")
+        
+        saver.save_output("jira task", "Epics content")
+        
+        self.assertIsNone(saver._jira_pool)
+        self.jira_connector.create_epics_and_stories.assert_not_called()
+    
+    def test_no_pool_for_other_artifacts(self):
+        """Test that saving a non-JIRA artifact starts no JIRA thread."""
+        filepath = self.saver.save_output("prd task", "PRD content")
+        
+        self.assertEqual(filepath, "/path/to/jira_stories.md")
+        self.assertIsNone(self.saver._jira_pool)
+        self.jira_connector.create_epics_and_stories.assert_not_called()
+    
+    def test_close_shuts_down_pool(self):
+        """Test that close() releases the JIRA thread."""
+        self.saver.save_output("jira task", "Epics content")
+        self.assertIsNotNone(self.saver._jira_pool)
+        
+        self.saver.close()
+        
+        self.assertIsNone(self.saver._jira_pool)
+
+if __name__ == "__main__":
+    unittest.main()